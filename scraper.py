@@ -1,20 +1,85 @@
 #!/usr/bin/env python3
+import asyncio
 import re
 import json
+import logging
+import multiprocessing
 import os
 import sys
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from typing import List, Optional
 from urllib.parse import urlparse, urljoin
-import requests
-from bs4 import BeautifulSoup
-from dataclasses import dataclass, asdict
+import ahocorasick
+import aiohttp
+from bs4 import BeautifulSoup, Comment, Tag
+from dataclasses import dataclass, fields
+
+logger = logging.getLogger(__name__)
 
 # Constants
 OUTPUT_DIR = "./output"
 IMAGE_DIR = "./image"
+MAX_CONCURRENCY = 20
+KEEPALIVE_TIMEOUT = 30
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = {502, 503, 504}
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+PARTIAL_DOWNLOAD_PREFIX = ".download-"
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
+HEADER_SEARCH_LENGTH = 200
+
+# Card type keywords
+_CARD_TYPES = {
+    "通常罠": "trap",
+    "永続罠": "trap",
+    "カウンター罠": "trap",
+    "通常魔法": "magic",
+    "永続魔法": "magic",
+    "速攻魔法": "magic",
+    "装備魔法": "magic",
+    "フィールド魔法": "magic",
+    "儀式魔法": "magic",
+    "リンクモンスター": "link",
+    "エクシーズモンスター": "xyz",
+    "Ｘモンスター": "xyz",
+    "シンクロモンスター": "synchro",
+    "融合モンスター": "fusion",
+    "通常モンスター": "monster",
+    "効果モンスター": "monster",
+}
+_MONSTER_TYPES = {"通常モンスター", "効果モンスター", "融合モンスター", "シンクロモンスター", "エクシーズモンスター", "リンクモンスター"}
+_LINK_DIRECTION_KEYWORDS = ["↖", "左上", "↑", "上", "↗", "右上", "←", "左", "→", "右", "↙", "左下", "↓", "下", "↘", "右下"]
+
+# Automaton matching every keyword above in a single pass over the text
+_KEYWORDS = ahocorasick.Automaton()
+for _keyword in [*_CARD_TYPES, *_LINK_DIRECTION_KEYWORDS]:
+    _KEYWORDS.add_word(_keyword, _keyword)
+_KEYWORDS.make_automaton()
+
+# Stats line: 星 X / 属性 / 種族 / 攻XXX [/ 守XXX]
+_STATS_RE = re.compile(r'星\s*(?P<lvl>\d+)\s*/\s*(?P<elem>\S+)\s*/\s*(?P<race>\S+族)\s*/\s*攻(?P<atk>\d+)(?:\s*/\s*守(?P<def>\d+))?')
+# Stats line without a level: 属性 / 種族 / 攻XXX
+_LINK_STATS_RE = re.compile(r'(?P<elem>\S+)\s*/\s*(?P<race>\S+族)\s*/\s*攻(?P<atk>\d+)')
+_LINK_RE = re.compile(r'LINK-(\d+)')
+_RANK_RE = re.compile(r'ランク\s*(\d+)')
+_LINK_DIRS_RE = re.compile(r'【LINK-\d+[：:](.*?)】')
+_HEADER_RE = re.compile(r'【([^】]+)】')
+_WS_RE = re.compile(r'\s+')
+
+# Filename sanitisation
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATORS_RE = re.compile(r'[-\s]+')
+
 
+def find_keywords(text: str) -> List[str]:
+    """Return the known keywords found in text, in order of appearance."""
+    return [keyword for _, keyword in _KEYWORDS.iter(text)]
 
-@dataclass
+
+@dataclass(slots=True)
 class BaseCard:
     card_name: str
     card_type: str
@@ -22,17 +87,17 @@ class BaseCard:
     image: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TrapCard(BaseCard):
     trap_type: str
     
 
-@dataclass
+@dataclass(slots=True)
 class MagicCard(BaseCard):
     magic_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MonsterCard(BaseCard):
     monster_type: str
     level: Optional[int]
@@ -47,7 +112,7 @@ class MonsterCard(BaseCard):
     canNormalSummon: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class XyzMonsterCard(MonsterCard):
     rank: int
     filterAvailableMaterials: str = "() => true"
@@ -59,19 +124,19 @@ class XyzMonsterCard(MonsterCard):
         self.level = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FusionMonsterCard(MonsterCard):
     filterAvailableMaterials: str = "() => true"
     materialCondition: str = "() => true"
 
 
-@dataclass
+@dataclass(slots=True)
 class SynchroMonsterCard(MonsterCard):
     filterAvailableMaterials: str = "() => true"
     materialCondition: str = "() => true"
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkMonsterCard(BaseCard):
     monster_type: str
     link: int
@@ -90,10 +155,23 @@ class LinkMonsterCard(BaseCard):
 
 class YugiohCardScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        }
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Image downloads in flight, keyed by filename
+        self._downloads: dict[str, asyncio.Task] = {}
+        self._partial_counter = itertools.count()
+        self._extractors = {
+            "trap": self.extract_trap_card,
+            "magic": self.extract_magic_card,
+            "monster": self.extract_monster_card,
+            "xyz": self.extract_xyz_card,
+            "fusion": self.extract_fusion_card,
+            "synchro": self.extract_synchro_card,
+            "link": self.extract_link_card,
+        }
     
     def read_urls_from_file(self, file_path: str) -> List[str]:
         """Read URLs from a text file."""
@@ -101,40 +179,75 @@ class YugiohCardScraper:
             urls = [line.strip() for line in f if line.strip()]
         return urls
     
-    def fetch_page(self, url: str) -> BeautifulSoup:
-        """Fetch and parse a page."""
-        response = self.session.get(url)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+    @asynccontextmanager
+    async def get(self, url: str):
+        """GET a URL, retrying connection errors and 502/503/504 with backoff."""
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                response = await self.session.get(url)
+            except aiohttp.ClientConnectionError:
+                if attempt == RETRY_TOTAL:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                    break
+                response.release()
+            await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+        
+        try:
+            response.raise_for_status()
+            yield response
+        finally:
+            # Return the connection to the pool rather than closing it
+            response.release()
+    
+    async def fetch_page(self, url: str) -> bytes:
+        """Fetch the raw HTML of a page."""
+        async with self.get(url) as response:
+            return await response.read()
     
-    def determine_card_type(self, soup: BeautifulSoup) -> str:
-        """Determine the type of card from the page."""
-        # Look for card description box
+    def parse_and_write(self, content: bytes) -> tuple[str, str, str, str]:
+        """Parse a page, save its TypeScript file and return (card_type, img_url, image, filename)."""
+        soup = BeautifulSoup(content, 'lxml')
         desc_box = soup.find('div', class_='cardDescription')
-        if not desc_box:
-            return "unknown"
+        desc_text = desc_box.get_text() if desc_box else ""
+        card_type = self.determine_card_type(desc_text)
+        
+        # Extract card based on type
+        card = None
+        img = soup.find('img', id='detail_def_img')
+        img_url, img_filename = self.extract_image_info(img)
+        extractor = self._extractors.get(card_type)
+        if extractor:
+            card = extractor(soup, desc_box, desc_text, img, img_filename)
         
-        text = desc_box.get_text()
+        if not card:
+            return card_type, "", "", ""
+        
+        # Save to TypeScript
+        safe_name = _UNSAFE_CHARS_RE.sub('', card.card_name)
+        safe_name = _SEPARATORS_RE.sub('_', safe_name)
+        filename = f"{safe_name}.ts"
+        self.save_to_typescript(card, filename)
+        
+        return card_type, img_url, card.image, filename
+    
+    def determine_card_type(self, text: str) -> str:
+        """Determine the type of card from the description text."""
+        # The type lives in the 【...】 header near the top, possibly after a
+        # marker such as (制限カード); only scan that slice
+        head = text.lstrip()[:HEADER_SEARCH_LENGTH]
+        header_match = _HEADER_RE.search(head)
+        header = header_match.group(1) if header_match else head
         
-        # Check for card types - order matters! Check more specific types first
-        if "通常罠" in text or "永続罠" in text or "カウンター罠" in text:
-            return "trap"
-        elif "通常魔法" in text or "永続魔法" in text or "速攻魔法" in text or "装備魔法" in text or "フィールド魔法" in text or "儀式魔法" in text:
-            return "magic"
-        elif "リンクモンスター" in text:
-            return "link"
-        elif "エクシーズモンスター" in text or "Ｘモンスター" in text:
-            return "xyz"
-        elif "シンクロモンスター" in text:
-            return "synchro"
-        elif "融合モンスター" in text:
-            return "fusion"
-        elif "通常モンスター" in text or "効果モンスター" in text:
-            return "monster"
+        # Leftmost keyword wins
+        for keyword in find_keywords(header):
+            if keyword in _CARD_TYPES:
+                return _CARD_TYPES[keyword]
         
         return "unknown"
     
-    def extract_card_name(self, soup: BeautifulSoup) -> str:
+    def extract_card_name(self, soup: BeautifulSoup, img: Optional[Tag]) -> str:
         """Extract card name from page."""
         # Try to get from JSON-LD
         json_ld = soup.find('script', type='application/ld+json')
@@ -147,15 +260,13 @@ class YugiohCardScraper:
                 pass
         
         # Try to get from image alt
-        img = soup.find('img', id='detail_def_img')
         if img and img.get('alt'):
             return img['alt']
         
         return ""
     
-    def extract_image_info(self, soup: BeautifulSoup) -> tuple[str, str]:
-        """Extract image URL and filename."""
-        img = soup.find('img', id='detail_def_img')
+    def extract_image_info(self, img: Optional[Tag]) -> tuple[str, str]:
+        """Extract image URL and filename from the card image tag."""
         if img and img.get('src'):
             img_url = img['src']
             if not img_url.startswith('http'):
@@ -164,26 +275,21 @@ class YugiohCardScraper:
             return img_url, filename
         return "", ""
     
-    def extract_card_text(self, soup: BeautifulSoup) -> str:
+    def extract_card_text(self, desc_box: Optional[Tag]) -> str:
         """Extract card text."""
-        desc_box = soup.find('div', class_='cardDescription')
         if desc_box:
-            # Get the raw HTML content
-            html_content = str(desc_box)
-            
-            # Remove excessive whitespace while preserving structure
-            html_content = re.sub(r'\s+', ' ', html_content)
-            
-            # Parse again with cleaned HTML
-            clean_soup = BeautifulSoup(html_content, 'html.parser')
-            p_tag = clean_soup.find('p')
+            p_tag = desc_box.find('p')
             
             if p_tag:
-                # Replace br tags with newlines
-                for br in p_tag.find_all("br"):
-                    br.replace_with("\n")
-                
-                text = p_tag.get_text()
+                # Collapse whitespace in text nodes and turn br tags into newlines
+                text_parts = []
+                for element in p_tag.descendants:
+                    if isinstance(element, Tag):
+                        if element.name == 'br':
+                            text_parts.append('\n')
+                    elif not isinstance(element, Comment):
+                        text_parts.append(_WS_RE.sub(' ', element))
+                text = ''.join(text_parts)
                 
                 # Split by newlines and process
                 parts = text.split('\n')
@@ -203,7 +309,7 @@ class YugiohCardScraper:
                         continue
                     
                     # Skip stats line
-                    if re.search(r'星\s*\d+\s*/\s*\S+\s*/\s*\S+族\s*/\s*攻\d+', part):
+                    if _STATS_RE.search(part):
                         found_card_type = True
                         continue
                     
@@ -218,20 +324,18 @@ class YugiohCardScraper:
                 return ' '.join(card_text_parts)
         return ""
     
-    def extract_trap_card(self, soup: BeautifulSoup) -> TrapCard:
+    def extract_trap_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> TrapCard:
         """Extract trap card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
         
         # Determine trap type
-        desc_box = soup.find('div', class_='cardDescription')
         trap_type = "通常罠"  # default
-        if desc_box:
-            desc_text = desc_box.get_text()
-            if "永続罠" in desc_text:
+        if desc_text:
+            found = set(find_keywords(desc_text))
+            if "永続罠" in found:
                 trap_type = "永続罠"
-            elif "カウンター罠" in desc_text:
+            elif "カウンター罠" in found:
                 trap_type = "カウンター罠"
         
         return TrapCard(
@@ -242,26 +346,24 @@ class YugiohCardScraper:
             image=img_filename
         )
     
-    def extract_magic_card(self, soup: BeautifulSoup) -> MagicCard:
+    def extract_magic_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> MagicCard:
         """Extract magic card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
         
         # Determine magic type
-        desc_box = soup.find('div', class_='cardDescription')
         magic_type = "通常魔法"  # default
-        if desc_box:
-            desc_text = desc_box.get_text()
-            if "永続魔法" in desc_text:
+        if desc_text:
+            found = set(find_keywords(desc_text))
+            if "永続魔法" in found:
                 magic_type = "永続魔法"
-            elif "速攻魔法" in desc_text:
+            elif "速攻魔法" in found:
                 magic_type = "速攻魔法"
-            elif "装備魔法" in desc_text:
+            elif "装備魔法" in found:
                 magic_type = "装備魔法"
-            elif "フィールド魔法" in desc_text:
+            elif "フィールド魔法" in found:
                 magic_type = "フィールド魔法"
-            elif "儀式魔法" in desc_text:
+            elif "儀式魔法" in found:
                 magic_type = "儀式魔法"
         
         return MagicCard(
@@ -272,65 +374,58 @@ class YugiohCardScraper:
             image=img_filename
         )
     
-    def extract_monster_stats(self, soup: BeautifulSoup) -> dict:
+    def extract_monster_stats(self, text: str) -> dict:
         """Extract monster statistics like ATK, DEF, Level, etc."""
         stats = {}
         
-        desc_box = soup.find('div', class_='cardDescription')
-        if desc_box:
-            text = desc_box.get_text()
+        if text:
+            keywords = find_keywords(text)
+            found = set(keywords)
             
             # Look for the stats line pattern: 星 X / 属性 / 種族 / 攻XXX / 守XXX
-            stats_line_match = re.search(r'星\s*(\d+)\s*/\s*(\S+)\s*/\s*(\S+族)\s*/\s*攻(\d+)\s*/\s*守(\d+)', text)
-            if stats_line_match:
-                stats['level'] = int(stats_line_match.group(1))
-                stats['element'] = stats_line_match.group(2)
-                stats['race'] = stats_line_match.group(3)
-                stats['attack'] = int(stats_line_match.group(4))
-                stats['defense'] = int(stats_line_match.group(5))
+            stats_line_match = _STATS_RE.search(text)
+            if stats_line_match and stats_line_match.group('def') is not None:
+                stats['level'] = int(stats_line_match.group('lvl'))
+                stats['element'] = stats_line_match.group('elem')
+                stats['race'] = stats_line_match.group('race')
+                stats['attack'] = int(stats_line_match.group('atk'))
+                stats['defense'] = int(stats_line_match.group('def'))
                 stats['hasDefense'] = True
                 stats['hasLevel'] = True
             else:
                 # Try Link monster pattern (no defense)
-                stats_line_match = re.search(r'(\S+)\s*/\s*(\S+族)\s*/\s*攻(\d+)', text)
+                if not stats_line_match:
+                    stats_line_match = _LINK_STATS_RE.search(text)
                 if stats_line_match:
-                    stats['element'] = stats_line_match.group(1)
-                    stats['race'] = stats_line_match.group(2)
-                    stats['attack'] = int(stats_line_match.group(3))
+                    stats['element'] = stats_line_match.group('elem')
+                    stats['race'] = stats_line_match.group('race')
+                    stats['attack'] = int(stats_line_match.group('atk'))
                     stats['hasDefense'] = False
                 
                 # Check for Link value
-                link_match = re.search(r'LINK-(\d+)', text)
+                link_match = _LINK_RE.search(text)
                 if link_match:
                     stats['link'] = int(link_match.group(1))
                     stats['hasLink'] = True
                     stats['hasLevel'] = False
                 
                 # Check for Rank (Xyz)
-                rank_match = re.search(r'ランク\s*(\d+)', text)
+                rank_match = _RANK_RE.search(text)
                 if rank_match:
                     stats['rank'] = int(rank_match.group(1))
                     stats['hasRank'] = True
                     stats['hasLevel'] = False
             
             # Determine monster type
-            if "通常モンスター" in text:
-                stats['monster_type'] = "通常モンスター"
-            elif "効果モンスター" in text:
-                stats['monster_type'] = "効果モンスター"
-            elif "融合モンスター" in text:
-                stats['monster_type'] = "融合モンスター"
-            elif "シンクロモンスター" in text:
-                stats['monster_type'] = "シンクロモンスター"
-            elif "エクシーズモンスター" in text:
-                stats['monster_type'] = "エクシーズモンスター"
-            elif "リンクモンスター" in text:
-                stats['monster_type'] = "リンクモンスター"
+            for keyword in keywords:
+                if keyword in _MONSTER_TYPES:
+                    stats['monster_type'] = keyword
+                    break
             
             # Extract link directions if it's a link monster
-            if stats.get('hasLink') or "リンクモンスター" in text:
+            if stats.get('hasLink') or "リンクモンスター" in found:
                 # Look for LINK pattern with directions
-                link_pattern = re.search(r'【LINK-\d+[：:](.*?)】', text)
+                link_pattern = _LINK_DIRS_RE.search(text)
                 if link_pattern:
                     dirs_text = link_pattern.group(1)
                     link_dirs = []
@@ -344,25 +439,24 @@ class YugiohCardScraper:
                 else:
                     # Fallback to arrow pattern
                     link_dirs = []
-                    if "↖" in text or "左上" in text: link_dirs.append("左上")
-                    if "↑" in text or "上" in text: link_dirs.append("上")
-                    if "↗" in text or "右上" in text: link_dirs.append("右上")
-                    if "←" in text or "左" in text: link_dirs.append("左")
-                    if "→" in text or "右" in text: link_dirs.append("右")
-                    if "↙" in text or "左下" in text: link_dirs.append("左下")
-                    if "↓" in text or "下" in text: link_dirs.append("下")
-                    if "↘" in text or "右下" in text: link_dirs.append("右下")
+                    if "↖" in found or "左上" in found: link_dirs.append("左上")
+                    if "↑" in found or "上" in found: link_dirs.append("上")
+                    if "↗" in found or "右上" in found: link_dirs.append("右上")
+                    if "←" in found or "左" in found: link_dirs.append("左")
+                    if "→" in found or "右" in found: link_dirs.append("右")
+                    if "↙" in found or "左下" in found: link_dirs.append("左下")
+                    if "↓" in found or "下" in found: link_dirs.append("下")
+                    if "↘" in found or "右下" in found: link_dirs.append("右下")
                     if link_dirs:
                         stats['linkDirection'] = link_dirs
             
         return stats
     
-    def extract_monster_card(self, soup: BeautifulSoup) -> MonsterCard:
+    def extract_monster_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> MonsterCard:
         """Extract normal/effect monster card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
-        stats = self.extract_monster_stats(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
+        stats = self.extract_monster_stats(desc_text)
         
         return MonsterCard(
             card_name=card_name,
@@ -382,17 +476,17 @@ class YugiohCardScraper:
             canNormalSummon=True if stats.get('monster_type') == '通常モンスター' else False
         )
     
-    def extract_xyz_card(self, soup: BeautifulSoup) -> XyzMonsterCard:
+    def extract_xyz_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> XyzMonsterCard:
         """Extract Xyz monster card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
-        stats = self.extract_monster_stats(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
+        stats = self.extract_monster_stats(desc_text)
         
         return XyzMonsterCard(
             card_name=card_name,
             card_type="モンスター",
             monster_type="エクシーズモンスター",
+            level=None,
             rank=stats.get('rank', stats.get('level', 0)),
             element=stats.get('element', ''),
             race=stats.get('race', ''),
@@ -401,15 +495,17 @@ class YugiohCardScraper:
             text=text,
             image=img_filename,
             hasDefense=True,
+            hasLevel=False,
+            hasRank=True,
+            hasLink=False,
             canNormalSummon=False
         )
     
-    def extract_fusion_card(self, soup: BeautifulSoup) -> FusionMonsterCard:
+    def extract_fusion_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> FusionMonsterCard:
         """Extract Fusion monster card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
-        stats = self.extract_monster_stats(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
+        stats = self.extract_monster_stats(desc_text)
         
         return FusionMonsterCard(
             card_name=card_name,
@@ -429,12 +525,11 @@ class YugiohCardScraper:
             canNormalSummon=False
         )
     
-    def extract_synchro_card(self, soup: BeautifulSoup) -> SynchroMonsterCard:
+    def extract_synchro_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> SynchroMonsterCard:
         """Extract Synchro monster card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
-        stats = self.extract_monster_stats(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
+        stats = self.extract_monster_stats(desc_text)
         
         return SynchroMonsterCard(
             card_name=card_name,
@@ -454,12 +549,11 @@ class YugiohCardScraper:
             canNormalSummon=False
         )
     
-    def extract_link_card(self, soup: BeautifulSoup) -> LinkMonsterCard:
+    def extract_link_card(self, soup: BeautifulSoup, desc_box: Optional[Tag], desc_text: str, img: Optional[Tag], img_filename: str) -> LinkMonsterCard:
         """Extract Link monster card information."""
-        card_name = self.extract_card_name(soup)
-        _, img_filename = self.extract_image_info(soup)
-        text = self.extract_card_text(soup)
-        stats = self.extract_monster_stats(soup)
+        card_name = self.extract_card_name(soup, img)
+        text = self.extract_card_text(desc_box)
+        stats = self.extract_monster_stats(desc_text)
         
         return LinkMonsterCard(
             card_name=card_name,
@@ -475,115 +569,153 @@ class YugiohCardScraper:
             canNormalSummon=False
         )
     
-    def download_image(self, img_url: str, filename: str):
-        """Download image to the image directory."""
+    async def download_image(self, img_url: str, filename: str) -> str:
+        """Download image to the image directory and return its status."""
         if not img_url:
-            return
+            return "none"
+        
+        # Another URL with the same image is already downloading it; wait for that
+        task = self._downloads.get(filename)
+        if task is not None:
+            status = await asyncio.shield(task)
+            return "exists" if status == "downloaded" else status
+        
+        filepath = os.path.join(IMAGE_DIR, filename)
+        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+            return "exists"
         
+        task = asyncio.ensure_future(self._fetch_image(img_url, filepath, filename))
+        self._downloads[filename] = task
+        task.add_done_callback(lambda _: self._downloads.pop(filename, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch_image(self, img_url: str, filepath: str, filename: str) -> str:
+        """Stream an image to filepath and return its status."""
         try:
-            response = self.session.get(img_url)
-            response.raise_for_status()
+            partpath = None
             
-            filepath = os.path.join(IMAGE_DIR, filename)
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            print(f"Downloaded: {filename}")
+            # Stream to a uniquely named temporary file so a failed download leaves nothing behind
+            try:
+                async with self.get(img_url) as response:
+                    name = f"{PARTIAL_DOWNLOAD_PREFIX}{filename}.{os.getpid()}.{next(self._partial_counter)}{PARTIAL_DOWNLOAD_SUFFIX}"
+                    f = open(os.path.join(IMAGE_DIR, name), 'xb')
+                    partpath = f.name
+                    with f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                os.replace(partpath, filepath)
+            finally:
+                if partpath and os.path.exists(partpath):
+                    os.remove(partpath)
         except Exception as e:
-            print(f"Failed to download image: {e}")
+            logger.warning("Failed to download image %s: %s", filename, e)
+            return "failed"
+        return "downloaded"
     
     def save_to_typescript(self, card: BaseCard, filename: str):
         """Save card data to TypeScript file."""
         filepath = os.path.join(OUTPUT_DIR, filename)
         
-        # Convert to dict and handle special fields
-        data = asdict(card)
+        # Read fields in declaration order without asdict's deep copy
+        data = [(field.name, getattr(card, field.name)) for field in fields(card)]
         
         # Create TypeScript content
-        ts_content = "export default {\n"
+        parts = ["export default {\n"]
         
-        for key, value in data.items():
+        for key, value in data:
             if key in ['filterAvailableMaterials', 'materialCondition']:
                 # These are functions, output as-is
-                ts_content += f'    {key}: {value},\n'
+                parts.append(f'    {key}: {value},\n')
             elif isinstance(value, str):
                 if key == 'card_type' or key == 'trap_type' or key == 'magic_type' or key == 'element' or key == 'race':
-                    ts_content += f'    {key}: "{value}" as const,\n'
+                    parts.append(f'    {key}: "{value}" as const,\n')
                 else:
-                    ts_content += f'    {key}: "{value}",\n'
+                    parts.append(f'    {key}: "{value}",\n')
             elif isinstance(value, bool):
-                ts_content += f'    {key}: {str(value).lower()} as const,\n'
+                parts.append(f'    {key}: {str(value).lower()} as const,\n')
             elif isinstance(value, list):
                 # For linkDirection
                 items = ', '.join([f'"{item}"' for item in value])
-                ts_content += f'    {key}: [{items}] as const,\n'
+                parts.append(f'    {key}: [{items}] as const,\n')
             elif value is None:
                 continue
             else:
-                ts_content += f'    {key}: {value},\n'
+                parts.append(f'    {key}: {value},\n')
         
-        ts_content += "};\n"
+        parts.append("};\n")
+        ts_content = ''.join(parts)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(ts_content)
-        
-        print(f"Saved: {filename}")
     
-    def process_url(self, url: str):
+    async def process_url(self, url: str):
         """Process a single URL."""
-        print(f"\nProcessing: {url}")
-        
         try:
-            soup = self.fetch_page(url)
-            card_type = self.determine_card_type(soup)
+            content = await self.fetch_page(url)
+            
+            # Parsing and serialisation are CPU-bound, so run them in the process pool
+            loop = asyncio.get_running_loop()
+            card_type, img_url, image, filename = await loop.run_in_executor(self.executor, parse_and_write, content)
             
             if card_type == "unknown":
-                print(f"Unable to determine card type for: {url}")
+                logger.warning("Unable to determine card type for: %s", url)
                 return
             
-            print(f"Card type: {card_type}")
-            
-            # Extract card based on type
-            card = None
-            if card_type == "trap":
-                card = self.extract_trap_card(soup)
-            elif card_type == "magic":
-                card = self.extract_magic_card(soup)
-            elif card_type == "monster":
-                card = self.extract_monster_card(soup)
-            elif card_type == "xyz":
-                card = self.extract_xyz_card(soup)
-            elif card_type == "fusion":
-                card = self.extract_fusion_card(soup)
-            elif card_type == "synchro":
-                card = self.extract_synchro_card(soup)
-            elif card_type == "link":
-                card = self.extract_link_card(soup)
-            
-            if card:
+            if filename:
                 # Download image
-                img_url, _ = self.extract_image_info(soup)
-                if img_url and card.image:
-                    self.download_image(img_url, card.image)
+                image_status = "none"
+                if img_url and image:
+                    image_status = await self.download_image(img_url, image)
                 
-                # Save to TypeScript
-                safe_name = re.sub(r'[^\w\s-]', '', card.card_name)
-                safe_name = re.sub(r'[-\s]+', '_', safe_name)
-                filename = f"{safe_name}.ts"
-                self.save_to_typescript(card, filename)
+                logger.info("%s: %s -> %s (image: %s)", url, card_type, filename, image_status)
                 
         except Exception as e:
-            print(f"Error processing {url}: {e}")
+            logger.error("Error processing %s: %s", url, e)
+    
+    def remove_partial_downloads(self):
+        """Remove partial image downloads left behind by an interrupted run."""
+        for name in os.listdir(IMAGE_DIR):
+            if name.startswith(PARTIAL_DOWNLOAD_PREFIX) and name.endswith(PARTIAL_DOWNLOAD_SUFFIX):
+                os.remove(os.path.join(IMAGE_DIR, name))
+    
+    async def process_urls(self, urls: List[str]):
+        """Process all URLs concurrently."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        
+        async def bounded_process_url(url: str):
+            async with semaphore:
+                await self.process_url(url)
+        
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY, keepalive_timeout=KEEPALIVE_TIMEOUT)
+        # spawn rather than fork: by the first submit aiohttp's resolver threads are running
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as executor:
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+                self.session = session
+                self.executor = executor
+                tasks = [bounded_process_url(url) for url in urls]
+                await asyncio.gather(*tasks, return_exceptions=True)
+        self.session = None
+        self.executor = None
+
+
+def parse_and_write(content: bytes) -> tuple[str, str, str, str]:
+    """Process pool entry point for YugiohCardScraper.parse_and_write."""
+    # The scraper holding the HTTP session can't be pickled, so use a fresh one
+    return YugiohCardScraper().parse_and_write(content)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     if len(sys.argv) < 2:
-        print("Usage: python scraper.py <urls_file.txt>")
+        logger.error("Usage: python scraper.py <urls_file.txt>")
         sys.exit(1)
     
     urls_file = sys.argv[1]
     
     if not os.path.exists(urls_file):
-        print(f"File not found: {urls_file}")
+        logger.error("File not found: %s", urls_file)
         sys.exit(1)
     
     # Create directories if they don't exist
@@ -592,16 +724,16 @@ def main():
     
     # Initialize scraper
     scraper = YugiohCardScraper()
+    scraper.remove_partial_downloads()
     
     # Read URLs
     urls = scraper.read_urls_from_file(urls_file)
-    print(f"Found {len(urls)} URLs to process")
+    logger.info("Found %d URLs to process", len(urls))
     
-    # Process each URL
-    for url in urls:
-        scraper.process_url(url)
+    # Process all URLs concurrently
+    asyncio.run(scraper.process_urls(urls))
     
-    print("\nProcessing complete!")
+    logger.info("Processing complete!")
 
 
 if __name__ == "__main__":